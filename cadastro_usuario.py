@@ -1,81 +1,341 @@
+import atexit
 import csv
+import io
 import json
+import mmap
 import os
 import re
 import configparser
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import random
+import sqlite3
 import string
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 
 config = configparser.ConfigParser()
 config.read('config.ini')
 
 DATA_FILE_CSV = config.get('settings', 'data_file_csv', fallback='cadastro.csv')
 DATA_FILE_JSON = config.get('settings', 'data_file_json', fallback='cadastro.json')
+DATA_FILE_NDJSON = config.get('settings', 'data_file_ndjson', fallback='cadastro.ndjson')
+DATA_FILE_DB = config.get('settings', 'data_file_db', fallback='cadastro.db')
 LOG_FILE = 'log.txt'
+FORMATOS = ('csv', 'json', 'ndjson', 'sqlite')
+TAMANHO_LOTE = config.getint('settings', 'tamanho_lote', fallback=1000)
+TAMANHO_BUFFER = 1 << 20
+TAMANHO_LOTE_LOG = 64
+LIMITE_CARGA_PARALELA = config.getint('settings', 'limite_carga_paralela', fallback=64 * 1024 * 1024)
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+NOMES = ['Ana', 'João', 'Maria', 'Pedro', 'Lucas', 'Fernanda', 'Juliana', 'Carlos']
+SOBRENOMES = ['Silva', 'Souza', 'Oliveira', 'Santos', 'Pereira', 'Lima', 'Eduarda', 'Miguel', 'Guilherme', 'Batata']
+_LETRAS = string.ascii_lowercase
+_RNG = random.Random()
 
 class Usuario:
     """Classe que representa um usuário."""
+    __slots__ = ('nome', 'email')
+
     def __init__(self, nome, email):
         self.nome = nome
         self.email = email
 
-    def to_dict(self):
-        return {"Nome": self.nome, "Email": self.email}
+def _linha_ndjson(usuario):
+    """Serializa um usuário como uma linha de NDJSON."""
+    dados = {"Nome": usuario.nome, "Email": usuario.email}
+    if orjson:
+        return orjson.dumps(dados) + b'\n'
+    return json.dumps(dados, ensure_ascii=False).encode('utf-8') + b'\n'
+
+def _ler_bloco_csv(caminho, inicio, fim):
+    """Lê o trecho [inicio, fim) do CSV (sem cabeçalho) e o converte em tuplas (nome, email)."""
+    with open(caminho, mode="rb") as arquivo:
+        arquivo.seek(inicio)
+        bloco = arquivo.read(fim - inicio)
+    return [(linha[0], linha[1]) for linha in csv.reader(io.StringIO(bloco.decode('utf-8'), newline='')) if linha]
 
 class SistemaCadastro:
     """Class que representa o sistema de cadastro de usuários."""
     def __init__(self):   
         self.usuarios = []
+        self._formato = 'csv'
+        self._indice_por_email = {}
+        self._nomes_min = []
+        self._emails_min = []
+        self._alteracoes_pendentes = 0
+        self._novos_pendentes = []
+        self._reescrever = False
+        self._comandos_sqlite = []
+        self._gravando = False
+        self._log_pendente = []
+        self._contador_gerados = 0
+        self._conexao = None
+
+    def _reindexar(self):
+        """Reconstrói o índice por email e as listas usadas na busca."""
+        self._indice_por_email = {usuario.email: indice for indice, usuario in enumerate(self.usuarios)}
+        # Cópias em minúsculas, paralelas a self.usuarios, para que a busca
+        # não chame lower() a cada usuário.
+        self._nomes_min = [usuario.nome.lower() for usuario in self.usuarios]
+        self._emails_min = [usuario.email.lower() for usuario in self.usuarios]
+
+    def _indexar(self, usuario):
+        """Acrescenta um usuário à lista e aos índices."""
+        self._indice_por_email[usuario.email] = len(self.usuarios)
+        self.usuarios.append(usuario)
+        self._nomes_min.append(usuario.nome.lower())
+        self._emails_min.append(usuario.email.lower())
+
+    def _desindexar(self, indice):
+        """Remove da lista e dos índices o usuário na posição informada."""
+        # Move o último usuário para a posição removida, evitando deslocar as listas.
+        listas = (self.usuarios, self._nomes_min, self._emails_min)
+        del self._indice_por_email[self.usuarios[indice].email]
+        ultimo = len(self.usuarios) - 1
+        if indice != ultimo:
+            for lista in listas:
+                lista[indice] = lista[ultimo]
+            self._indice_por_email[self.usuarios[indice].email] = indice
+        for lista in listas:
+            lista.pop()
+
+    def _conectar_sqlite(self):
+        """Abre (uma única vez) o banco SQLite e cria a tabela de usuários."""
+        if self._conexao is None:
+            self._conexao = sqlite3.connect(DATA_FILE_DB)
+            self._conexao.execute('PRAGMA journal_mode=WAL')
+            self._conexao.execute('CREATE TABLE IF NOT EXISTS usuarios (email TEXT PRIMARY KEY, nome TEXT NOT NULL)')
+        return self._conexao
+
+    def encerrar(self):
+        """Grava as alterações pendentes e o log e fecha o banco de dados."""
+        self._gravar_log()
+        if self._conexao is not None:
+            self._conexao.close()
+            self._conexao = None
 
     def log_event(self, message):
         """Registra eventos em um arquivo de log."""
+        self._log_pendente.append(f"{datetime.now()}: {message}\n")
+        if len(self._log_pendente) >= TAMANHO_LOTE_LOG:
+            self._gravar_log()
+
+    def _gravar_log(self):
+        """Grava no arquivo de log os eventos acumulados."""
+        # Os dados são gravados antes do log, para que o log não registre uma
+        # alteração que ainda não chegou ao arquivo.
+        self.gravar_alteracoes()
+        if not self._log_pendente:
+            return
         with open(LOG_FILE, mode='a', encoding='utf-8') as log_file:
-            log_file.write(f"{datetime.now()}: {message}\n")
+            log_file.writelines(self._log_pendente)
+        self._log_pendente.clear()
   
     def validar_email(self, email):
         """Valida o formato de um endereço de e-mail."""
-        padrao = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(padrao, email) is not None
+        # Descarta e-mails obviamente inválidos antes de executar a regex.
+        if email.count('@') != 1:
+            return False
+        _, _, dominio = email.partition('@')
+        if '.' not in dominio:
+            return False
+        return _EMAIL_RE.match(email) is not None
 
     def validar_nome(self, nome):
         """Verifica se o nome não está vazio ou contém apenas espaços."""
         return bool(nome.strip())
 
-    def carregar_usuarios(self, formato='csv'):
-        """Carrega usuários de um arquivo, seja CSV ou JSON."""
+    def carregar_usuarios(self, formato=None):
+        """Carrega usuários de um arquivo, seja CSV, JSON, NDJSON ou SQLite."""
+        if formato is not None and formato not in FORMATOS:
+            self.log_event(f"Erro ao carregar usuários: formato desconhecido '{formato}'.")
+            self.mensagem_erro(f"Formato desconhecido '{formato}'. Use um de: {', '.join(FORMATOS)}.")
+            return
+        # As alterações pendentes pertencem ao formato carregado antes; elas são
+        # gravadas nele antes de trocar para o novo formato.
+        self.gravar_alteracoes()
+        if formato is None:
+            formato = self._formato
+        self._formato = formato
+        # Nome local: evita a busca global de Usuario a cada linha lida.
+        usuario_cls = Usuario
         try:
             if formato == 'csv':
-                if not os.path.isfile(DATA_FILE_CSV):
-                    return []
-                with open(DATA_FILE_CSV, mode="r", encoding='utf-8') as arquivo:
-                    reader = csv.DictReader(arquivo)
-                    self.usuarios = [Usuario(linha['Nome'], linha['Email']) for linha in reader]
+                with open(DATA_FILE_CSV, mode="r", encoding='utf-8', buffering=TAMANHO_BUFFER) as arquivo:
+                    # Só vale a pena dividir a leitura em arquivos grandes e com mais de um núcleo.
+                    tamanho = os.fstat(arquivo.fileno()).st_size
+                    if (os.cpu_count() or 1) > 1 and tamanho > 0 and tamanho >= LIMITE_CARGA_PARALELA:
+                        self.usuarios = self._carregar_csv_paralelo(arquivo.fileno())
+                    else:
+                        reader = csv.reader(arquivo)
+                        next(reader, None)  # cabeçalho "Nome,Email"
+                        self.usuarios = [usuario_cls(linha[0], linha[1]) for linha in reader if linha]
             elif formato == 'json':
-                if not os.path.isfile(DATA_FILE_JSON):
-                    return []
-                with open(DATA_FILE_JSON, mode="r", encoding='utf-8') as arquivo:
-                    data = json.load(arquivo)
-                    self.usuarios = [Usuario(usuario['Nome'], usuario['Email']) for usuario in data]
+                with open(DATA_FILE_JSON, mode="rb", buffering=TAMANHO_BUFFER) as arquivo:
+                    if ijson:
+                        # Lê os registros um a um, sem montar o documento inteiro na memória.
+                        data = ijson.items(arquivo, 'item')
+                    else:
+                        conteudo = arquivo.read()
+                        data = orjson.loads(conteudo) if orjson else json.loads(conteudo)
+                    self.usuarios = [usuario_cls(usuario['Nome'], usuario['Email']) for usuario in data]
+            elif formato == 'ndjson':
+                with open(DATA_FILE_NDJSON, mode="rb", buffering=TAMANHO_BUFFER) as arquivo:
+                    carregar = orjson.loads if orjson else json.loads
+                    data = (carregar(linha) for linha in arquivo if linha.strip())
+                    self.usuarios = [usuario_cls(usuario['Nome'], usuario['Email']) for usuario in data]
+            elif formato == 'sqlite':
+                cursor = self._conectar_sqlite().execute('SELECT nome, email FROM usuarios ORDER BY rowid')
+                self.usuarios = [usuario_cls(nome, email) for nome, email in cursor]
+        except FileNotFoundError:
+            self.usuarios = []
         except Exception as e:
             self.log_event(f"Erro ao carregar usuários: {e}")
             print(f"Erro ao carregar usuários: {e}")
+        self._reindexar()
+
+    def _carregar_csv_paralelo(self, descritor):
+        """Lê um CSV grande dividindo-o em blocos processados em paralelo."""
+        # Os blocos são cortados em quebras de linha. Nenhum campo contém '\n',
+        # já que nomes e emails vêm de input(), então o corte nunca cai no
+        # meio de um registro.
+        # O mapa só serve para achar os pontos de corte; cada processo lê o
+        # próprio trecho do arquivo, sem que ele passe pelo processo principal.
+        with mmap.mmap(descritor, 0, access=mmap.ACCESS_READ) as mapa:
+            inicio = mapa.find(b'\n') + 1  # pula o cabeçalho
+            if inicio == 0:
+                return []
+            tamanho = len(mapa)
+            partes = os.cpu_count()
+            limites = [inicio]
+            for k in range(1, partes):
+                corte = mapa.find(b'\n', inicio + k * (tamanho - inicio) // partes) + 1
+                if corte == 0:
+                    break
+                if corte > limites[-1]:
+                    limites.append(corte)
+            limites.append(tamanho)
+        inicios = [a for a, b in zip(limites, limites[1:]) if b > a]
+        fins = [b for a, b in zip(limites, limites[1:]) if b > a]
+
+        with ProcessPoolExecutor() as executor:
+            blocos = executor.map(_ler_bloco_csv, [DATA_FILE_CSV] * len(inicios), inicios, fins)
+            return [Usuario(nome, email) for linhas in blocos for nome, email in linhas]
 
     def salvar_usuarios(self, formato='csv'):  
-        """Salva a lista de usuários em um arquivo, seja CSV ou JSON."""
+        """Salva a lista de usuários em um arquivo, seja CSV, JSON, NDJSON ou SQLite."""
         try:
             if formato == 'csv':
                 with open(DATA_FILE_CSV, mode="w", newline='', encoding='utf-8') as arquivo:
-                    writer = csv.DictWriter(arquivo, fieldnames=["Nome", "Email"])
-                    writer.writeheader()
-                    writer.writerows(usuario.to_dict() for usuario in self.usuarios)
+                    writer = csv.writer(arquivo)
+                    writer.writerow(("Nome", "Email"))
+                    writer.writerows((usuario.nome, usuario.email) for usuario in self.usuarios)
             elif formato == 'json': 
-                with open(DATA_FILE_JSON, mode="w", encoding='utf-8') as arquivo:
-                    json.dump([usuario.to_dict() for usuario in self.usuarios], arquivo, indent=4)
+                dados = [{"Nome": usuario.nome, "Email": usuario.email} for usuario in self.usuarios]
+                if orjson:
+                    with open(DATA_FILE_JSON, mode="wb") as arquivo:
+                        arquivo.write(orjson.dumps(dados, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(DATA_FILE_JSON, mode="w", encoding='utf-8') as arquivo:
+                        json.dump(dados, arquivo, indent=2, ensure_ascii=False)
+            elif formato == 'ndjson':
+                with open(DATA_FILE_NDJSON, mode="wb") as arquivo:
+                    arquivo.writelines(_linha_ndjson(usuario) for usuario in self.usuarios)
+            elif formato == 'sqlite':
+                with self._conectar_sqlite() as conexao:
+                    conexao.execute('DELETE FROM usuarios')
+                    conexao.executemany('INSERT INTO usuarios (email, nome) VALUES (?, ?)',
+                                        ((usuario.email, usuario.nome) for usuario in self.usuarios))
+            else:
+                raise ValueError(f"formato desconhecido '{formato}'")
+            return True
+        except Exception as e:
+            self.log_event(f"Erro ao salvar usuários: {e}")
+            print(f"Erro ao salvar usuários: {e}")
+            return False
+
+    def _anexar_usuarios(self, usuarios, formato='csv'):
+        """Acrescenta usuários ao final do arquivo CSV ou NDJSON sem reescrevê-lo."""
+        try:
+            if formato == 'csv':
+                with open(DATA_FILE_CSV, mode="a", newline='', encoding='utf-8') as arquivo:
+                    writer = csv.writer(arquivo)
+                    if arquivo.tell() == 0:
+                        writer.writerow(("Nome", "Email"))
+                    writer.writerows((usuario.nome, usuario.email) for usuario in usuarios)
+            elif formato == 'ndjson':
+                with open(DATA_FILE_NDJSON, mode="ab") as arquivo:
+                    arquivo.writelines(_linha_ndjson(usuario) for usuario in usuarios)
+            else:
+                raise ValueError(f"formato não suporta acréscimo: '{formato}'")
+            return True
+        except Exception as e:
+            self.log_event(f"Erro ao salvar usuários: {e}")
+            print(f"Erro ao salvar usuários: {e}")
+            return False
+
+    def _executar_comandos_sqlite(self, comandos):
+        """Aplica ao banco SQLite, em uma única transação, os comandos pendentes."""
+        try:
+            with self._conectar_sqlite() as conexao:
+                for sql, parametros in comandos:
+                    conexao.execute(sql, parametros)
+            return True
         except Exception as e:
             self.log_event(f"Erro ao salvar usuários: {e}")
             print(f"Erro ao salvar usuários: {e}")
+            return False
+
+    def gravar_alteracoes(self):
+        """Grava no arquivo do formato carregado as alterações pendentes, se houver."""
+        # Uma falha ao gravar registra o erro no log, que por sua vez tenta
+        # gravar os dados de novo; a flag evita essa recursão.
+        if not self._alteracoes_pendentes or self._gravando:
+            return
+        self._gravando = True
+        try:
+            gravado = self._gravar_pendentes(self._formato)
+        finally:
+            self._gravando = False
+        if gravado:
+            self._alteracoes_pendentes = 0
+            self._novos_pendentes = []
+            self._reescrever = False
+            self._comandos_sqlite = []
+
+    def _gravar_pendentes(self, formato):
+        """Escolhe como gravar o lote pendente no formato informado."""
+        # No SQLite cada alteração vira um INSERT/UPDATE/DELETE pontual. Nos
+        # arquivos, cadastros apenas acrescentam linhas ao CSV/NDJSON; remoções,
+        # atualizações e o formato JSON exigem reescrever o arquivo inteiro.
+        if formato == 'sqlite':
+            return self._executar_comandos_sqlite(self._comandos_sqlite)
+        if self._reescrever or formato == 'json':
+            return self.salvar_usuarios(formato)
+        return self._anexar_usuarios(self._novos_pendentes, formato)
+
+    def _registrar_alteracao(self, comando_sqlite, novo_usuario=None):
+        """Marca uma alteração pendente e grava o lote quando ele enche."""
+        if novo_usuario is None:
+            self._reescrever = True
+        else:
+            self._novos_pendentes.append(novo_usuario)
+        self._comandos_sqlite.append(comando_sqlite)
+        self._alteracoes_pendentes += 1
+        if self._alteracoes_pendentes >= TAMANHO_LOTE:
+            self.gravar_alteracoes()
 
     def cadastrar_usuario(self, nome, email):
         """Cadastra um novo usuário no sistema."""
@@ -87,13 +347,13 @@ class SistemaCadastro:
             self.mensagem_erro("Email inválido. Tente novamente.")
             return False
 
-        if any(usuario.email == email for usuario in self.usuarios):
+        if email in self._indice_por_email:
             self.mensagem_erro("Um usuário com este email já está cadastrado.")
             return False
         
         usuario = Usuario(nome, email)
-        self.usuarios.append(usuario)
-        self.salvar_usuarios()
+        self._indexar(usuario)
+        self._registrar_alteracao(('INSERT INTO usuarios (email, nome) VALUES (?, ?)', (email, nome)), usuario)
         self.log_event(f"Usuário '{nome}' com email '{email}' cadastrado.")
         self.mensagem_sucesso(f"Usuário '{nome}' cadastrado com sucesso!")
         return True
@@ -112,19 +372,21 @@ class SistemaCadastro:
 
     def apagar_usuario(self, email):
         """Remove um usuário pelo seu email."""
-        for usuario in self.usuarios:
-            if usuario.email == email:
-                self.usuarios.remove(usuario)
-                self.salvar_usuarios()
-                self.log_event(f"Usuário com email '{email}' removido.")
-                self.mensagem_sucesso(f"Usuário com email '{email}' removido com sucesso!")
-                return
-        
-        self.mensagem_erro(f"Nenhum usuário encontrado com o email '{email}'.")
+        indice = self._indice_por_email.get(email)
+        if indice is None:
+            self.mensagem_erro(f"Nenhum usuário encontrado com o email '{email}'.")
+            return
+
+        self._desindexar(indice)
+        self._registrar_alteracao(('DELETE FROM usuarios WHERE email = ?', (email,)))
+        self.log_event(f"Usuário com email '{email}' removido.")
+        self.mensagem_sucesso(f"Usuário com email '{email}' removido com sucesso!")
 
     def buscar_usuario(self, criterio):
         """Busca um usuário pelo nome ou email."""
-        encontrados = [usuario for usuario in self.usuarios if criterio.lower() in usuario.nome.lower() or criterio.lower() in usuario.email.lower()]
+        criterio_min = criterio.lower()
+        usuarios = self.usuarios
+        encontrados = [usuarios[i] for i, (nome, email) in enumerate(zip(self._nomes_min, self._emails_min)) if criterio_min in nome or criterio_min in email]
         
         if not encontrados:
             self.mensagem_erro(f"Nenhum usuário encontrado com '{criterio}'.")
@@ -136,19 +398,29 @@ class SistemaCadastro:
 
     def atualizar_usuario(self, email, novo_nome=None, novo_email=None):
         """Atualiza o nome ou email de um usuário existente."""
-        for usuario in self.usuarios:
-            if usuario.email == email:
-                if novo_nome and self.validar_nome(novo_nome):
-                    usuario.nome = novo_nome
-                if novo_email and self.validar_email(novo_email):
-                    usuario.email = novo_email
-                
-                self.salvar_usuarios()
-                self.log_event(f"Usuário com email '{email}' atualizado para nome '{usuario.nome}' e email '{usuario.email}'.")
-                self.mensagem_sucesso(f"Usuário com email '{email}' atualizado com sucesso!")
-                return
-            
-        self.mensagem_erro(f"Nenhum usuário encontrado com o email '{email}'.")
+        indice = self._indice_por_email.get(email)
+        if indice is None:
+            self.mensagem_erro(f"Nenhum usuário encontrado com o email '{email}'.")
+            return
+
+        if novo_email and novo_email != email and novo_email in self._indice_por_email:
+            self.mensagem_erro("Um usuário com este email já está cadastrado.")
+            return
+
+        usuario = self.usuarios[indice]
+        if novo_nome and self.validar_nome(novo_nome):
+            usuario.nome = novo_nome
+            self._nomes_min[indice] = novo_nome.lower()
+        if novo_email and novo_email != email and self.validar_email(novo_email):
+            del self._indice_por_email[email]
+            usuario.email = novo_email
+            self._indice_por_email[novo_email] = indice
+            self._emails_min[indice] = novo_email.lower()
+
+        self._registrar_alteracao(('UPDATE usuarios SET nome = ?, email = ? WHERE email = ?',
+                                   (usuario.nome, usuario.email, email)))
+        self.log_event(f"Usuário com email '{email}' atualizado para nome '{usuario.nome}' e email '{usuario.email}'.")
+        self.mensagem_sucesso(f"Usuário com email '{email}' atualizado com sucesso!")
 
     def mensagem_erro(self, mensagem):
         """Exibe uma mensagem de erro."""
@@ -158,26 +430,37 @@ class SistemaCadastro:
         """Exibe uma mensagem de sucesso."""
         print(f"Sucesso: {mensagem}")
 
-    def gerar_nome_aleatorio(self):
-        """Gera um nome aleatório simples."""
-        nomes = ['Ana', 'João', 'Maria', 'Pedro', 'Lucas', 'Fernanda', 'Juliana', 'Carlos']
-        sobrenomes = ['Silva', 'Souza', 'Oliveira', 'Santos', 'Pereira', 'Lima', 'Eduarda', 'Miguel', 'Guilherme', 'Batata']
-        return f"{random.choice(nomes)} {random.choice(sobrenomes)}"
+    def _montar_email(self, nome, letras):
+        """Monta um e-mail a partir do nome e das letras sorteadas para o domínio."""
+        # O contador torna cada e-mail gerado nesta execução único.
+        self._contador_gerados += 1
+        dominio = letras + "gmail.com"
+        nome_usuario = nome.replace(" ", ".").lower()  
+        return f"{nome_usuario}.{self._contador_gerados}@{dominio}"
 
     def gerar_email_aleatorio(self, nome):
         """Gera um e-mail aleatório baseado no nome."""
-        dominio = ''.join(random.choices(string.ascii_lowercase, k=5)) + "gmail.com"
-        nome_usuario = nome.replace(" ", ".").lower()  
-        return f"{nome_usuario}@{dominio}"
+        return self._montar_email(nome, ''.join(_RNG.choices(_LETRAS, k=5)))
 
     def gerar_usuario_aleatorio(self):
         """Gera um usuário com nome e email aleatórios."""
-        nome = self.gerar_nome_aleatorio()
-        email = self.gerar_email_aleatorio(nome)
-        while any(usuario.email == email for usuario in self.usuarios):
-            email = self.gerar_email_aleatorio(nome)  
+        self.gerar_usuarios_aleatorios(1)
+
+    def gerar_usuarios_aleatorios(self, quantidade):
+        """Gera vários usuários com nomes e emails aleatórios de uma só vez."""
+        # Sorteia nomes, sobrenomes e letras do lote inteiro em poucas chamadas.
+        nomes = _RNG.choices(NOMES, k=quantidade)
+        sobrenomes = _RNG.choices(SOBRENOMES, k=quantidade)
+        letras = ''.join(_RNG.choices(_LETRAS, k=5 * quantidade))
+        for i, (primeiro_nome, sobrenome) in enumerate(zip(nomes, sobrenomes)):
+            nome = f"{primeiro_nome} {sobrenome}"
+            email = self._montar_email(nome, letras[5 * i:5 * i + 5])
+            # O contador não é persistido, então ainda pode coincidir com um
+            # e-mail salvo em uma execução anterior.
+            while email in self._indice_por_email:
+                email = self.gerar_email_aleatorio(nome)
 
-        self.cadastrar_usuario(nome, email)
+            self.cadastrar_usuario(nome, email)
 
 def menu(sistema):
     """Exibe o menu principal do sistema."""
@@ -187,7 +470,7 @@ def menu(sistema):
         "3": "Apagar usuário",
         "4": "Buscar usuário",
         "5": "Atualizar usuário",
-        "6": "Gerar um usuário aleatório",
+        "6": "Gerar usuários aleatórios",
         "7": "Sair"
     }
     
@@ -217,8 +500,13 @@ def menu(sistema):
             novo_email = input("Digite o novo email (deixe vazio para não alterar): ")
             sistema.atualizar_usuario(email, novo_nome.strip() or None, novo_email.strip() or None)
         elif escolha == "6":
-            sistema.gerar_usuario_aleatorio()
+            quantidade = input("Quantos usuários deseja gerar? (padrão 1): ").strip() or "1"
+            if quantidade.isdecimal() and int(quantidade) > 0:
+                sistema.gerar_usuarios_aleatorios(int(quantidade))
+            else:
+                print("Erro: Quantidade inválida! Tente novamente.")
         elif escolha == "7":
+            sistema.gravar_alteracoes()
             print("Saindo do sistema...")
             break
         else:
@@ -226,5 +514,6 @@ def menu(sistema):
 
 if __name__ == "__main__":
     sistema = SistemaCadastro()
+    atexit.register(sistema.encerrar)
     sistema.carregar_usuarios()
     menu(sistema)